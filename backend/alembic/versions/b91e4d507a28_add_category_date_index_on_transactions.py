@@ -0,0 +1,34 @@
+"""add category/date index on transactions
+
+Revision ID: b91e4d507a28
+Revises: e7a25c8f31d4
+Create Date: 2026-08-27 11:26:18.904513
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b91e4d507a28'
+down_revision: Union[str, Sequence[str], None] = 'e7a25c8f31d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_transactions_live_category_date',
+        'transactions',
+        ['category_id', sa.text('date DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        sqlite_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transactions_live_category_date', table_name='transactions')
@@ -0,0 +1,50 @@
+"""add partial indexes for soft-delete filters
+
+Revision ID: c4f1d9b02e61
+Revises: 87663c31f367
+Create Date: 2026-08-27 09:14:02.519384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f1d9b02e61'
+down_revision: Union[str, Sequence[str], None] = '87663c31f367'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_categories_live_name',
+        'categories',
+        ['name'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        sqlite_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_recurring_expenses_live_user_name',
+        'recurring_expenses',
+        ['user_id', 'name'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        sqlite_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_transactions_live_user_date',
+        'transactions',
+        ['user_id', sa.text('date DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        sqlite_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transactions_live_user_date', table_name='transactions')
+    op.drop_index('ix_recurring_expenses_live_user_name', table_name='recurring_expenses')
+    op.drop_index('ix_categories_live_name', table_name='categories')
@@ -0,0 +1,28 @@
+"""add created_at index on users
+
+Revision ID: d53a9f82c176
+Revises: b91e4d507a28
+Create Date: 2026-08-27 12:41:35.278164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd53a9f82c176'
+down_revision: Union[str, Sequence[str], None] = 'b91e4d507a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_created_at', 'users', ['created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_created_at', table_name='users')
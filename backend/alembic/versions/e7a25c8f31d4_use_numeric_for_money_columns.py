@@ -0,0 +1,54 @@
+"""use numeric for money columns
+
+Revision ID: e7a25c8f31d4
+Revises: c4f1d9b02e61
+Create Date: 2026-08-27 10:02:47.812266
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a25c8f31d4'
+down_revision: Union[str, Sequence[str], None] = 'c4f1d9b02e61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'transactions',
+        'amount',
+        existing_type=sa.Float(),
+        type_=sa.Numeric(14, 2),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'recurring_expenses',
+        'amount',
+        existing_type=sa.Float(),
+        type_=sa.Numeric(14, 2),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'recurring_expenses',
+        'amount',
+        existing_type=sa.Numeric(14, 2),
+        type_=sa.Float(),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'transactions',
+        'amount',
+        existing_type=sa.Numeric(14, 2),
+        type_=sa.Float(),
+        existing_nullable=False,
+    )
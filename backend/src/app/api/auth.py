@@ -2,12 +2,12 @@ from app.db.session import get_db
 from app.models.auth import LoginRequest, LoginResponse, RegisterRequest, RegisterResponse
 from app.services.auth import AuthService
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
     return AuthService(session=db)
 
 
@@ -15,10 +15,10 @@ AuthServiceDep = Depends(get_auth_service)
 
 
 @router.post("/register", response_model=RegisterResponse, status_code=201)
-def register(body: RegisterRequest, service: AuthService = AuthServiceDep):
-    return service.register(body)
+async def register(body: RegisterRequest, service: AuthService = AuthServiceDep):
+    return await service.register(body)
 
 
 @router.post("/login", response_model=LoginResponse)
-def login(body: LoginRequest, service: AuthService = AuthServiceDep):
-    return service.login(body)
+async def login(body: LoginRequest, service: AuthService = AuthServiceDep):
+    return await service.login(body)
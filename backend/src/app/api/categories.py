@@ -1,7 +1,7 @@
 import uuid
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import CurrentUser
 from app.db.session import get_db
@@ -11,7 +11,7 @@ from app.services.categories import CategoriesService
 router = APIRouter(prefix="/categories", tags=["categories"])
 
 
-def get_categories_service(db: Session = Depends(get_db)) -> CategoriesService:
+def get_categories_service(db: AsyncSession = Depends(get_db)) -> CategoriesService:
     return CategoriesService(session=db)
 
 
@@ -19,36 +19,44 @@ CategoriesServiceDep = Depends(get_categories_service)
 
 
 @router.get("/", response_model=list[CategoryResponse])
-def list_categories(
+async def list_categories(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     service: CategoriesService = CategoriesServiceDep,
 ):
-    return service.list_categories(current_user.id)
+    # Conditional GET: answer 304 from a cheap aggregate instead of
+    # fetching and serializing the whole list when nothing changed.
+    etag = await service.list_categories_etag(current_user.id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    return await service.list_categories(current_user.id)
 
 
 @router.post("/", response_model=CategoryResponse, status_code=201)
-def create_category(
+async def create_category(
     body: CategoryCreate,
     current_user: CurrentUser,
     service: CategoriesService = CategoriesServiceDep,
 ):
-    return service.create_category(body, current_user.id)
+    return await service.create_category(body, current_user.id)
 
 
 @router.patch("/{category_id}", response_model=CategoryResponse)
-def update_category(
+async def update_category(
     category_id: uuid.UUID,
     body: CategoryUpdate,
     current_user: CurrentUser,
     service: CategoriesService = CategoriesServiceDep,
 ):
-    return service.update_category(category_id, current_user.id, body)
+    return await service.update_category(category_id, current_user.id, body)
 
 
 @router.delete("/{category_id}", status_code=204)
-def delete_category(
+async def delete_category(
     category_id: uuid.UUID,
     current_user: CurrentUser,
     service: CategoriesService = CategoriesServiceDep,
 ):
-    service.delete_category(category_id, current_user.id)
+    await service.delete_category(category_id, current_user.id)
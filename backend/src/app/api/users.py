@@ -1,7 +1,7 @@
 import uuid
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import CurrentUser
 from app.db.session import get_db
@@ -11,7 +11,7 @@ from app.services.users import UsersService
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-def get_users_service(db: Session = Depends(get_db)) -> UsersService:
+def get_users_service(db: AsyncSession = Depends(get_db)) -> UsersService:
     return UsersService(session=db)
 
 
@@ -19,35 +19,35 @@ UsersServiceDep = Depends(get_users_service)
 
 
 @router.get("/", response_model=list[UserResponse])
-def list_users(service: UsersService = UsersServiceDep):
-    return service.list_users()
+async def list_users(service: UsersService = UsersServiceDep):
+    return await service.list_users()
 
 
 @router.post("/", response_model=UserResponse, status_code=201)
-def create_user(body: UserCreate, service: UsersService = UsersServiceDep):
-    return service.create_user(body)
+async def create_user(body: UserCreate, service: UsersService = UsersServiceDep):
+    return await service.create_user(body)
 
 
 # /me must be defined before /{user_id} to avoid path conflict
 @router.delete("/me", status_code=204)
-def delete_me(current_user: CurrentUser, service: UsersService = UsersServiceDep):
-    service.delete_user(current_user.id)
+async def delete_me(current_user: CurrentUser, service: UsersService = UsersServiceDep):
+    await service.delete_user(current_user.id)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(user_id: uuid.UUID, service: UsersService = UsersServiceDep):
-    return service.get_user(user_id)
+async def get_user(user_id: uuid.UUID, service: UsersService = UsersServiceDep):
+    return await service.get_user(user_id)
 
 
 @router.patch("/{user_id}", response_model=UserResponse)
-def update_user(
+async def update_user(
     user_id: uuid.UUID,
     body: UserUpdate,
     service: UsersService = UsersServiceDep,
 ):
-    return service.update_user(user_id, body)
+    return await service.update_user(user_id, body)
 
 
 @router.delete("/{user_id}", status_code=204)
-def delete_user(user_id: uuid.UUID, service: UsersService = UsersServiceDep):
-    service.delete_user(user_id)
+async def delete_user(user_id: uuid.UUID, service: UsersService = UsersServiceDep):
+    await service.delete_user(user_id)
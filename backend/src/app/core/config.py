@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,4 +21,10 @@ class Settings(BaseSettings):
         return self.database_url
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once; .env parsing is not free and never changes."""
+    return Settings()
+
+
+settings = get_settings()
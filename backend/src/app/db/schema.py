@@ -1,9 +1,21 @@
 import enum
+import os
+import time
 import uuid
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum as SAEnum, ForeignKey, String, Text
+from sqlalchemy import (
+    DateTime,
+    Enum as SAEnum,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -12,9 +24,26 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _uuid7() -> uuid.UUID:
+    """Time-ordered UUIDv7 (RFC 9562).
+
+    Unlike random UUIDv4, v7 keys are monotonic by millisecond, so btree
+    inserts land on the same hot leaf page instead of splitting pages all
+    over the index.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = timestamp_ms << 80
+    value |= 0x7 << 76  # version 7
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a (12 bits)
+    value |= 0x2 << 62  # RFC 4122 variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b (62 bits)
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=_uuid7
     )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_now)
     updated_at: Mapped[datetime] = mapped_column(
@@ -45,6 +74,8 @@ class RecurrenceFrequency(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    # list_users orders by created_at; keep it an index walk.
+    __table_args__ = (Index("ix_users_created_at", "created_at"),)
 
     email: Mapped[str] = mapped_column(String(256), unique=True, index=True)
     name: Mapped[str] = mapped_column(String(128))
@@ -58,6 +89,16 @@ class User(Base):
 
 class Category(Base):
     __tablename__ = "categories"
+    # Partial index over live rows only: list_categories always filters
+    # deleted_at IS NULL and orders by name.
+    __table_args__ = (
+        Index(
+            "ix_categories_live_name",
+            "name",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("users.id"))
     name: Mapped[str] = mapped_column(String(50))
@@ -77,10 +118,19 @@ class Category(Base):
 
 class RecurringExpense(Base):
     __tablename__ = "recurring_expenses"
+    __table_args__ = (
+        Index(
+            "ix_recurring_expenses_live_user_name",
+            "user_id",
+            "name",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"))
     name: Mapped[str] = mapped_column(String(255))
-    amount: Mapped[float]
+    amount: Mapped[Decimal] = mapped_column(Numeric(14, 2))
     category_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("categories.id"))
     due_day: Mapped[int]
     notes: Mapped[Optional[str]] = mapped_column(Text)
@@ -96,13 +146,31 @@ class RecurringExpense(Base):
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    # Matches list_transactions: filter by user over live rows, newest first.
+    __table_args__ = (
+        Index(
+            "ix_transactions_live_user_date",
+            "user_id",
+            text("date DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        # Serves category filters and per-category spend aggregations.
+        Index(
+            "ix_transactions_live_category_date",
+            "category_id",
+            text("date DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"))
     type: Mapped[TransactionType] = mapped_column(
         SAEnum(TransactionType, name="transactiontype")
     )
     description: Mapped[str] = mapped_column(String(255))
-    amount: Mapped[float]
+    amount: Mapped[Decimal] = mapped_column(Numeric(14, 2))
     date: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     category_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         ForeignKey("categories.id")
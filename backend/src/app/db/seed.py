@@ -4,6 +4,10 @@ Run via: make db-seed
 Idempotent — safe to run multiple times.
 """
 
+import asyncio
+
+from sqlalchemy import func, select
+
 from app.db.schema import Category
 from app.db.session import SessionLocal
 
@@ -22,14 +26,15 @@ DEFAULT_CATEGORIES = [
 ]
 
 
-def seed_default_categories() -> None:
-    session = SessionLocal()
-    try:
+async def seed_default_categories() -> None:
+    async with SessionLocal() as session:
         existing = (
-            session.query(Category)
-            .filter(Category.is_default.is_(True))
-            .count()
-        )
+            await session.execute(
+                select(func.count()).select_from(Category).where(
+                    Category.is_default.is_(True)
+                )
+            )
+        ).scalar_one()
         if existing > 0:
             print(f"Default categories already exist ({existing} found). Skipping.")
             return
@@ -43,11 +48,9 @@ def seed_default_categories() -> None:
                     user_id=None,
                 )
             )
-        session.commit()
+        await session.commit()
         print(f"Seeded {len(DEFAULT_CATEGORIES)} default categories.")
-    finally:
-        session.close()
 
 
 if __name__ == "__main__":
-    seed_default_categories()
+    asyncio.run(seed_default_categories())
@@ -1,25 +1,14 @@
+from typing import Annotated
+
+from app.models.fields import NonEmptyStr
 from app.models.user import UserResponse
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, EmailStr, StringConstraints
 
 
 class RegisterRequest(BaseModel):
     email: EmailStr
-    name: str
-    password: str
-
-    @field_validator("name")
-    @classmethod
-    def name_not_empty(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError("name must not be empty")
-        return v.strip()
-
-    @field_validator("password")
-    @classmethod
-    def password_min_length(cls, v: str) -> str:
-        if len(v) < 8:
-            raise ValueError("password must be at least 8 characters")
-        return v
+    name: NonEmptyStr
+    password: Annotated[str, StringConstraints(min_length=8)]
 
 
 class LoginRequest(BaseModel):
@@ -36,5 +25,3 @@ class RegisterResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
     user: UserResponse
-
-
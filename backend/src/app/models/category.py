@@ -2,32 +2,20 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict
+
+from app.models.fields import NonEmptyStr
 
 
 class CategoryCreate(BaseModel):
-    name: str
+    name: NonEmptyStr
     color: str
 
-    @field_validator("name")
-    @classmethod
-    def name_not_empty(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError("name must not be empty")
-        return v.strip()
-
 
 class CategoryUpdate(BaseModel):
-    name: Optional[str] = None
+    name: Optional[NonEmptyStr] = None
     color: Optional[str] = None
 
-    @field_validator("name")
-    @classmethod
-    def name_not_empty(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not v.strip():
-            raise ValueError("name must not be empty")
-        return v.strip() if v else v
-
 
 class CategoryResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
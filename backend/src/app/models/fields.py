@@ -0,0 +1,15 @@
+"""Shared annotated field types.
+
+Declarative constraints run inside pydantic-core (Rust) instead of a
+Python ``@field_validator`` frame per request.
+"""
+
+from typing import Annotated
+
+from pydantic import Field, StringConstraints
+
+# Strips surrounding whitespace and rejects empty/blank values.
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+# Money amounts must be strictly positive.
+PositiveAmount = Annotated[float, Field(gt=0)]
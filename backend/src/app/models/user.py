@@ -2,32 +2,20 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr
+
+from app.models.fields import NonEmptyStr
 
 
 class UserCreate(BaseModel):
     email: EmailStr
-    name: str
+    name: NonEmptyStr
     password: str
 
-    @field_validator("name")
-    @classmethod
-    def name_not_empty(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError("name must not be empty")
-        return v.strip()
-
 
 class UserUpdate(BaseModel):
     email: Optional[EmailStr] = None
-    name: Optional[str] = None
-
-    @field_validator("name")
-    @classmethod
-    def name_not_empty(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not v.strip():
-            raise ValueError("name must not be empty")
-        return v.strip() if v else v
+    name: Optional[NonEmptyStr] = None
 
 
 class UserResponse(BaseModel):
@@ -1,3 +1,8 @@
+import asyncio
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
 from app.core.security import create_access_token, hash_password, verify_password
 from app.db.schema import User
 from app.models.auth import (
@@ -11,33 +16,54 @@ from fastapi import HTTPException, status
 
 
 class AuthService(BaseService):
-    def register(self, body: RegisterRequest) -> RegisterResponse:
-        existing = self.session.query(User).filter(User.email == body.email).first()
+    async def register(self, body: RegisterRequest) -> RegisterResponse:
+        # Probe only the id so a duplicate email fails before the hash.
+        existing = (
+            await self.session.execute(
+                select(User.id).where(User.email == body.email)
+            )
+        ).first()
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Email already registered",
             )
-        user = User(
-            email=body.email,
-            name=body.name,
-            hashed_password=hash_password(body.password),
+        stmt = (
+            insert(User)
+            .values(
+                email=body.email,
+                name=body.name,
+                # Hashing is deliberately slow; keep it off the event loop.
+                hashed_password=await asyncio.to_thread(
+                    hash_password, body.password
+                ),
+            )
+            .returning(User)
         )
-        self.session.add(user)
-        self.session.commit()
-        self.session.refresh(user)
+        try:
+            user = (await self.session.execute(stmt)).scalar_one()
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Email already registered",
+            )
         return RegisterResponse(
             access_token=create_access_token(user.id),
             user=user,
         )
 
-    def login(self, body: LoginRequest) -> LoginResponse:
-        user = self.session.query(User).filter(User.email == body.email).first()
-        if not user or not verify_password(body.password, user.hashed_password):
+    async def login(self, body: LoginRequest) -> LoginResponse:
+        user = (
+            await self.session.execute(select(User).where(User.email == body.email))
+        ).scalar_one_or_none()
+        if not user or not await asyncio.to_thread(
+            verify_password, body.password, user.hashed_password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         return LoginResponse(access_token=create_access_token(user.id))
-
@@ -1,66 +1,148 @@
+import hashlib
+import time
 import uuid
-from datetime import datetime, timezone
 
 from fastapi import HTTPException
-from sqlalchemy import or_
+from pydantic import TypeAdapter
+from sqlalchemy import func, insert, lambda_stmt, or_, select, update
 
 from app.db.schema import Category
-from app.models.category import CategoryCreate, CategoryUpdate
+from app.models.category import CategoryCreate, CategoryResponse, CategoryUpdate
 from app.services.base import BaseService
 
+# Built once at import: validates a whole ORM result list in a single
+# pydantic-core call instead of constructing models row by row.
+_category_list_adapter = TypeAdapter(list[CategoryResponse])
+
+# Categories change rarely but are read on every transaction form render.
+# Keep the TTL short so stale entries are bounded even if an invalidation
+# is missed (e.g. a write from another process).
+_CACHE_TTL_SECONDS = 30.0
+
+_list_cache: dict[uuid.UUID, tuple[float, list[CategoryResponse]]] = {}
+
+
+def _invalidate_list_cache(user_id: uuid.UUID) -> None:
+    _list_cache.pop(user_id, None)
+
 
 class CategoriesService(BaseService):
 
-    def list_categories(self, user_id: uuid.UUID) -> list[Category]:
-        return (
-            self.session.query(Category)
-            .filter(
+    async def list_categories(self, user_id: uuid.UUID) -> list[CategoryResponse]:
+        cached = _list_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL_SECONDS:
+            return cached[1]
+
+        # lambda_stmt memoizes statement construction and compilation;
+        # user_id is tracked as a bind parameter between calls.
+        stmt = lambda_stmt(
+            lambda: select(Category)
+            .where(
                 Category.deleted_at.is_(None),
                 or_(Category.user_id.is_(None), Category.user_id == user_id),
             )
             .order_by(Category.name)
-            .all()
         )
+        result = await self.session.execute(stmt)
+        categories = _category_list_adapter.validate_python(
+            result.scalars().all(), from_attributes=True
+        )
+        _list_cache[user_id] = (time.monotonic(), categories)
+        return categories
 
-    def get_category(self, category_id: uuid.UUID) -> Category:
-        category = (
-            self.session.query(Category)
-            .filter(Category.id == category_id, Category.deleted_at.is_(None))
-            .first()
+    async def list_categories_etag(self, user_id: uuid.UUID) -> str:
+        """Cheap fingerprint of the user's visible category list.
+
+        max(updated_at) + row count changes whenever a visible row is
+        created, updated or soft-deleted, so it is safe to answer 304
+        against it without serializing the list.
+        """
+        stmt = select(func.max(Category.updated_at), func.count()).where(
+            Category.deleted_at.is_(None),
+            or_(Category.user_id.is_(None), Category.user_id == user_id),
         )
+        max_updated, count = (await self.session.execute(stmt)).one()
+        return hashlib.blake2b(
+            f"{user_id}:{max_updated}:{count}".encode()
+        ).hexdigest()[:16]
+
+    async def get_category(self, category_id: uuid.UUID) -> Category:
+        stmt = lambda_stmt(
+            lambda: select(Category).where(
+                Category.id == category_id, Category.deleted_at.is_(None)
+            )
+        )
+        category = (await self.session.execute(stmt)).scalar_one_or_none()
         if not category:
             raise HTTPException(status_code=404, detail="Category not found")
         return category
 
-    def create_category(self, body: CategoryCreate, user_id: uuid.UUID) -> Category:
-        category = Category(**body.model_dump(), user_id=user_id, is_default=False)
-        self.session.add(category)
-        self.session.commit()
-        self.session.refresh(category)
+    async def create_category(
+        self, body: CategoryCreate, user_id: uuid.UUID
+    ) -> Category:
+        stmt = (
+            insert(Category)
+            .values(**body.model_dump(), user_id=user_id, is_default=False)
+            .returning(Category)
+        )
+        category = (await self.session.execute(stmt)).scalar_one()
+        await self.session.commit()
+        _invalidate_list_cache(user_id)
         return category
 
-    def update_category(
+    async def update_category(
         self, category_id: uuid.UUID, user_id: uuid.UUID, body: CategoryUpdate
     ) -> Category:
-        category = self.get_category(category_id)
-        if category.is_default or category.user_id != user_id:
-            raise HTTPException(
-                status_code=403, detail="Cannot modify a default category"
+        updates = {k: getattr(body, k) for k in body.model_fields_set}
+        category = None
+        if updates:
+            stmt = (
+                update(Category)
+                .where(
+                    Category.id == category_id,
+                    Category.deleted_at.is_(None),
+                    Category.is_default.is_(False),
+                    Category.user_id == user_id,
+                )
+                .values(**updates)
+                .returning(Category)
             )
-        updates = body.model_dump(exclude_unset=True)
-        for field, value in updates.items():
-            setattr(category, field, value)
-        self.session.commit()
-        self.session.refresh(category)
+            category = (await self.session.execute(stmt)).scalar_one_or_none()
+        if category is None:
+            # Empty patch, missing row, or a default/foreign category:
+            # resolve which via the plain lookup.
+            category = await self.get_category(category_id)
+            if category.is_default or category.user_id != user_id:
+                raise HTTPException(
+                    status_code=403, detail="Cannot modify a default category"
+                )
+            if not updates:
+                return category
+        await self.session.commit()
+        _invalidate_list_cache(user_id)
         return category
 
-    def delete_category(
+    async def delete_category(
         self, category_id: uuid.UUID, user_id: uuid.UUID
     ) -> None:
-        category = self.get_category(category_id)
-        if category.is_default or category.user_id != user_id:
+        stmt = (
+            update(Category)
+            .where(
+                Category.id == category_id,
+                Category.deleted_at.is_(None),
+                Category.is_default.is_(False),
+                Category.user_id == user_id,
+            )
+            .values(deleted_at=func.now())
+            .returning(Category.id)
+        )
+        deleted = (await self.session.execute(stmt)).first()
+        if deleted is None:
+            # Nothing matched: 404 if the category doesn't exist, 403 if it
+            # does but is default or owned by someone else.
+            await self.get_category(category_id)
             raise HTTPException(
                 status_code=403, detail="Cannot delete a default category"
             )
-        category.deleted_at = datetime.now(timezone.utc)
-        self.session.commit()
+        await self.session.commit()
+        _invalidate_list_cache(user_id)
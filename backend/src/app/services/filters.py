@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
-from sqlalchemy.orm import Query
+from sqlalchemy import Select
 
 
 @dataclass(frozen=True)
@@ -12,13 +12,13 @@ class FilterSpec:
 
 
 def apply_filters(
-    query: Query,
+    stmt: Select,
     specs: list[FilterSpec],
     params: dict[str, Any],
-) -> Query:
+) -> Select:
     clauses = [
         spec.build(params[spec.param])
         for spec in specs
         if spec.applies(params.get(spec.param))
     ]
-    return query.filter(*clauses) if clauses else query
+    return stmt.where(*clauses) if clauses else stmt
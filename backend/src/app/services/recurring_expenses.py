@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime, timezone
 
 from fastapi import HTTPException
+from sqlalchemy import func, insert, lambda_stmt, select, update
 from sqlalchemy.orm import joinedload
 
 from app.db.schema import RecurringExpense, Transaction, TransactionType
@@ -16,32 +17,46 @@ from app.services.base import BaseService
 
 class RecurringExpensesService(BaseService):
 
-    def _query(self, user_id: uuid.UUID):
+    def _stmt(self, user_id: uuid.UUID):
         return (
-            self.session.query(RecurringExpense)
+            select(RecurringExpense)
             .options(joinedload(RecurringExpense.category))
-            .filter(
+            .where(
                 RecurringExpense.user_id == user_id,
                 RecurringExpense.deleted_at.is_(None),
             )
         )
 
-    def list_recurring_expenses(
+    async def list_recurring_expenses(
         self, user_id: uuid.UUID
     ) -> list[RecurringExpenseResponse]:
         billing_period = datetime.now(timezone.utc).strftime("%Y-%m")
-        expenses = self._query(user_id).order_by(RecurringExpense.name).all()
+        expenses = (
+            (
+                await self.session.execute(
+                    self._stmt(user_id).order_by(RecurringExpense.name)
+                )
+            )
+            .scalars()
+            .all()
+        )
 
-        paid_map: dict[uuid.UUID, uuid.UUID] = {
-            t.recurring_expense_id: t.id
-            for t in self.session.query(Transaction)
-            .filter(
-                Transaction.user_id == user_id,
-                Transaction.billing_period == billing_period,
-                Transaction.recurring_expense_id.isnot(None),
-                Transaction.deleted_at.is_(None),
+        paid_rows = (
+            (
+                await self.session.execute(
+                    select(Transaction).where(
+                        Transaction.user_id == user_id,
+                        Transaction.billing_period == billing_period,
+                        Transaction.recurring_expense_id.isnot(None),
+                        Transaction.deleted_at.is_(None),
+                    )
+                )
             )
+            .scalars()
             .all()
+        )
+        paid_map: dict[uuid.UUID, uuid.UUID] = {
+            t.recurring_expense_id: t.id for t in paid_rows
         }
 
         results = []
@@ -63,59 +78,95 @@ class RecurringExpensesService(BaseService):
             results.append(RecurringExpenseResponse.model_validate(data))
         return results
 
-    def get_recurring_expense(
+    async def get_recurring_expense(
         self, expense_id: uuid.UUID, user_id: uuid.UUID
     ) -> RecurringExpense:
         expense = (
-            self._query(user_id).filter(RecurringExpense.id == expense_id).first()
-        )
+            await self.session.execute(
+                self._stmt(user_id).where(RecurringExpense.id == expense_id)
+            )
+        ).scalar_one_or_none()
         if not expense:
             raise HTTPException(status_code=404, detail="Recurring expense not found")
         return expense
 
-    def create_recurring_expense(
+    async def create_recurring_expense(
         self, body: RecurringExpenseCreate, user_id: uuid.UUID
     ) -> RecurringExpenseResponse:
-        expense = RecurringExpense(**body.model_dump(), user_id=user_id)
-        self.session.add(expense)
-        self.session.commit()
-        self.session.refresh(expense)
+        stmt = (
+            insert(RecurringExpense)
+            .values(**body.model_dump(), user_id=user_id)
+            .returning(RecurringExpense)
+        )
+        expense = (await self.session.execute(stmt)).scalar_one()
+        await self.session.commit()
+        await self.session.refresh(expense, attribute_names=["category"])
         return self._to_response(expense, is_paid=False, paid_transaction_id=None)
 
-    def update_recurring_expense(
+    async def update_recurring_expense(
         self,
         expense_id: uuid.UUID,
         user_id: uuid.UUID,
         body: RecurringExpenseUpdate,
     ) -> RecurringExpenseResponse:
-        expense = self.get_recurring_expense(expense_id, user_id)
-        updates = body.model_dump(exclude_unset=True)
-        for field, value in updates.items():
-            setattr(expense, field, value)
-        self.session.commit()
-        self.session.refresh(expense)
+        updates = {k: getattr(body, k) for k in body.model_fields_set}
+        if updates:
+            stmt = (
+                update(RecurringExpense)
+                .where(
+                    RecurringExpense.id == expense_id,
+                    RecurringExpense.user_id == user_id,
+                    RecurringExpense.deleted_at.is_(None),
+                )
+                .values(**updates)
+                .returning(RecurringExpense)
+            )
+            expense = (await self.session.execute(stmt)).scalar_one_or_none()
+            if expense is None:
+                raise HTTPException(
+                    status_code=404, detail="Recurring expense not found"
+                )
+            await self.session.commit()
+        else:
+            expense = await self.get_recurring_expense(expense_id, user_id)
+        await self.session.refresh(expense, attribute_names=["category"])
         billing_period = datetime.now(timezone.utc).strftime("%Y-%m")
-        paid_txn = self._find_paid_transaction(expense_id, user_id, billing_period)
+        paid_txn = await self._find_paid_transaction(
+            expense_id, user_id, billing_period
+        )
         return self._to_response(
             expense,
             is_paid=paid_txn is not None,
             paid_transaction_id=paid_txn.id if paid_txn else None,
         )
 
-    def delete_recurring_expense(
+    async def delete_recurring_expense(
         self, expense_id: uuid.UUID, user_id: uuid.UUID
     ) -> None:
-        expense = self.get_recurring_expense(expense_id, user_id)
-        expense.deleted_at = datetime.now(timezone.utc)
-        self.session.commit()
+        stmt = (
+            update(RecurringExpense)
+            .where(
+                RecurringExpense.id == expense_id,
+                RecurringExpense.user_id == user_id,
+                RecurringExpense.deleted_at.is_(None),
+            )
+            .values(deleted_at=func.now())
+            .returning(RecurringExpense.id)
+        )
+        deleted = (await self.session.execute(stmt)).first()
+        if deleted is None:
+            raise HTTPException(status_code=404, detail="Recurring expense not found")
+        await self.session.commit()
 
-    def mark_paid(
+    async def mark_paid(
         self, expense_id: uuid.UUID, user_id: uuid.UUID, body: MarkPaidBody
     ) -> Transaction:
-        expense = self.get_recurring_expense(expense_id, user_id)
+        expense = await self.get_recurring_expense(expense_id, user_id)
         billing_period = datetime.now(timezone.utc).strftime("%Y-%m")
 
-        existing = self._find_paid_transaction(expense_id, user_id, billing_period)
+        existing = await self._find_paid_transaction(
+            expense_id, user_id, billing_period
+        )
         if existing:
             raise HTTPException(
                 status_code=409,
@@ -134,42 +185,46 @@ class RecurringExpensesService(BaseService):
             billing_period=billing_period,
         )
         self.session.add(transaction)
-        self.session.commit()
-        self.session.refresh(transaction)
-
-        return (
-            self.session.query(Transaction)
-            .options(joinedload(Transaction.category))
-            .filter(Transaction.id == transaction.id)
-            .first()
-        )
+        await self.session.commit()
+        await self.session.refresh(transaction, attribute_names=["category"])
+        return transaction
 
-    def mark_unpaid(self, expense_id: uuid.UUID, user_id: uuid.UUID) -> None:
-        self.get_recurring_expense(expense_id, user_id)
+    async def mark_unpaid(self, expense_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        await self.get_recurring_expense(expense_id, user_id)
         billing_period = datetime.now(timezone.utc).strftime("%Y-%m")
 
-        transaction = self._find_paid_transaction(expense_id, user_id, billing_period)
-        if not transaction:
+        stmt = (
+            update(Transaction)
+            .where(
+                Transaction.recurring_expense_id == expense_id,
+                Transaction.user_id == user_id,
+                Transaction.billing_period == billing_period,
+                Transaction.deleted_at.is_(None),
+            )
+            .values(deleted_at=func.now())
+            .returning(Transaction.id)
+        )
+        deleted = (await self.session.execute(stmt)).first()
+        if deleted is None:
             raise HTTPException(
                 status_code=404,
                 detail="No paid transaction found for this period",
             )
-        transaction.deleted_at = datetime.now(timezone.utc)
-        self.session.commit()
+        await self.session.commit()
 
-    def _find_paid_transaction(
+    async def _find_paid_transaction(
         self, expense_id: uuid.UUID, user_id: uuid.UUID, billing_period: str
     ):
-        return (
-            self.session.query(Transaction)
-            .filter(
+        # Runs on every list/update/mark-paid call; cache construction.
+        stmt = lambda_stmt(
+            lambda: select(Transaction).where(
                 Transaction.recurring_expense_id == expense_id,
                 Transaction.user_id == user_id,
                 Transaction.billing_period == billing_period,
                 Transaction.deleted_at.is_(None),
             )
-            .first()
         )
+        return (await self.session.execute(stmt)).scalar_one_or_none()
 
     def _to_response(
         self,
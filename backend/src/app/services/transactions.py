@@ -4,7 +4,8 @@ from datetime import datetime, timezone
 from typing import Any
 
 from fastapi import HTTPException
-from sqlalchemy.orm import joinedload
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from app.db.schema import Transaction, TransactionType
 from app.models.transaction import TransactionCreate, TransactionUpdate
@@ -34,14 +35,20 @@ TRANSACTION_FILTERS: list[FilterSpec] = [
 
 class TransactionsService(BaseService):
 
-    def _query(self, user_id: uuid.UUID):
+    def _stmt(self, user_id: uuid.UUID):
+        # selectinload fetches categories with one SELECT ... IN instead of
+        # repeating the same joined category columns on every transaction
+        # row — fewer bytes on the wire when many rows share a category.
+        # raiseload("*") turns any future lazy load (a new relationship
+        # nobody eager-configured) into a loud error instead of a per-row
+        # SELECT during serialization.
         return (
-            self.session.query(Transaction)
-            .options(joinedload(Transaction.category))
-            .filter(Transaction.user_id == user_id, Transaction.deleted_at.is_(None))
+            select(Transaction)
+            .options(selectinload(Transaction.category), raiseload("*"))
+            .where(Transaction.user_id == user_id, Transaction.deleted_at.is_(None))
         )
 
-    def list_transactions(
+    async def list_transactions(
         self,
         user_id: uuid.UUID,
         page: int = 1,
@@ -50,21 +57,29 @@ class TransactionsService(BaseService):
         sort_order: str = "desc",
         **filters: Any,
     ) -> dict[str, Any]:
-        query = self._query(user_id)
+        stmt = self._stmt(user_id)
 
-        query = apply_filters(query, TRANSACTION_FILTERS, filters)
+        stmt = apply_filters(stmt, TRANSACTION_FILTERS, filters)
 
-        total = query.count()
+        total = (
+            await self.session.execute(
+                select(func.count()).select_from(stmt.subquery())
+            )
+        ).scalar_one()
 
         sort_column = getattr(Transaction, sort_by, Transaction.date)
         if sort_order == "asc":
-            query = query.order_by(sort_column.asc())
+            stmt = stmt.order_by(sort_column.asc())
         else:
-            query = query.order_by(sort_column.desc())
+            stmt = stmt.order_by(sort_column.desc())
 
         page_size = min(page_size, 50)
         offset = (page - 1) * page_size
-        items = query.offset(offset).limit(page_size).all()
+        items = (
+            (await self.session.execute(stmt.offset(offset).limit(page_size)))
+            .scalars()
+            .all()
+        )
 
         return {
             "items": items,
@@ -74,65 +89,116 @@ class TransactionsService(BaseService):
             "total_pages": math.ceil(total / page_size) if page_size > 0 else 0,
         }
 
-    def get_transaction(
+    async def get_transaction(
         self, transaction_id: uuid.UUID, user_id: uuid.UUID
     ) -> Transaction:
-        transaction = (
-            self._query(user_id)
-            .filter(Transaction.id == transaction_id)
-            .first()
+        # PK lookup via the identity map; ownership and soft-delete are
+        # checked on the instance since they can't go in the PK criteria.
+        transaction = await self.session.get(
+            Transaction,
+            transaction_id,
+            options=[selectinload(Transaction.category), raiseload("*")],
         )
-        if not transaction:
+        if (
+            transaction is None
+            or transaction.user_id != user_id
+            or transaction.deleted_at is not None
+        ):
             raise HTTPException(status_code=404, detail="Transaction not found")
         return transaction
 
-    def create_transaction(
+    async def create_transaction(
         self, body: TransactionCreate, user_id: uuid.UUID
     ) -> Transaction:
-        transaction = Transaction(**body.model_dump(), user_id=user_id)
-        self.session.add(transaction)
-        self.session.commit()
-        self.session.refresh(transaction)
-        return self.get_transaction(transaction.id, user_id)
+        stmt = (
+            insert(Transaction)
+            .values(**body.model_dump(), user_id=user_id)
+            .returning(Transaction)
+        )
+        transaction = (await self.session.execute(stmt)).scalar_one()
+        await self.session.commit()
+        # Load the relationship on the attached instance instead of
+        # re-running the full joined SELECT via get_transaction.
+        await self.session.refresh(transaction, attribute_names=["category"])
+        return transaction
 
-    def update_transaction(
+    async def bulk_create_transactions(
+        self, items: list[TransactionCreate], user_id: uuid.UUID
+    ) -> int:
+        """Insert many transactions in a single executemany INSERT."""
+        if not items:
+            return 0
+        await self.session.execute(
+            insert(Transaction),
+            [{**item.model_dump(), "user_id": user_id} for item in items],
+        )
+        await self.session.commit()
+        return len(items)
+
+    async def update_transaction(
         self,
         transaction_id: uuid.UUID,
         user_id: uuid.UUID,
         body: TransactionUpdate,
     ) -> Transaction:
-        transaction = self.get_transaction(transaction_id, user_id)
-        updates = body.model_dump(exclude_unset=True)
-        for field, value in updates.items():
-            setattr(transaction, field, value)
-        self.session.commit()
-        self.session.refresh(transaction)
-        return self.get_transaction(transaction.id, user_id)
-
-    def delete_transaction(
+        updates = {k: getattr(body, k) for k in body.model_fields_set}
+        if not updates:
+            return await self.get_transaction(transaction_id, user_id)
+        stmt = (
+            update(Transaction)
+            .where(
+                Transaction.id == transaction_id,
+                Transaction.user_id == user_id,
+                Transaction.deleted_at.is_(None),
+            )
+            .values(**updates)
+            .returning(Transaction)
+        )
+        transaction = (await self.session.execute(stmt)).scalar_one_or_none()
+        if transaction is None:
+            raise HTTPException(status_code=404, detail="Transaction not found")
+        await self.session.commit()
+        await self.session.refresh(transaction, attribute_names=["category"])
+        return transaction
+
+    async def delete_transaction(
         self, transaction_id: uuid.UUID, user_id: uuid.UUID
     ) -> None:
-        transaction = self.get_transaction(transaction_id, user_id)
-        transaction.deleted_at = datetime.now(timezone.utc)
-        self.session.commit()
+        stmt = (
+            update(Transaction)
+            .where(
+                Transaction.id == transaction_id,
+                Transaction.user_id == user_id,
+                Transaction.deleted_at.is_(None),
+            )
+            # Server-side timestamp: no per-delete Python datetime, and
+            # consistent with the database clock.
+            .values(deleted_at=func.now())
+            .returning(Transaction.id)
+        )
+        deleted = (await self.session.execute(stmt)).first()
+        if deleted is None:
+            raise HTTPException(status_code=404, detail="Transaction not found")
+        await self.session.commit()
 
-    def restore_transaction(
+    async def restore_transaction(
         self, transaction_id: uuid.UUID, user_id: uuid.UUID
     ) -> Transaction:
         # Need to find even soft-deleted transactions for restore
         transaction = (
-            self.session.query(Transaction)
-            .options(joinedload(Transaction.category))
-            .filter(
-                Transaction.id == transaction_id,
-                Transaction.user_id == user_id,
-                Transaction.deleted_at.isnot(None),
+            await self.session.execute(
+                select(Transaction)
+                .options(joinedload(Transaction.category))
+                .where(
+                    Transaction.id == transaction_id,
+                    Transaction.user_id == user_id,
+                    Transaction.deleted_at.isnot(None),
+                )
             )
-            .first()
-        )
+        ).scalar_one_or_none()
         if not transaction:
             raise HTTPException(status_code=404, detail="Transaction not found")
         transaction.deleted_at = None
-        self.session.commit()
-        self.session.refresh(transaction)
-        return self.get_transaction(transaction.id, user_id)
+        await self.session.commit()
+        await self.session.refresh(transaction, attribute_names=["category"])
+        return transaction
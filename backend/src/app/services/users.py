@@ -1,47 +1,91 @@
+import asyncio
 import uuid
 
 from fastapi import HTTPException
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from pydantic import TypeAdapter
 
 from app.core.security import hash_password
 from app.db.schema import User
-from app.models.user import UserCreate, UserUpdate
+from app.models.user import UserCreate, UserResponse, UserUpdate
 from app.services.base import BaseService
 
 
+# Parameter-less: build once at import, skip per-call construction.
+# Column projection: the wire model never exposes hashed_password, so
+# don't fetch it or build ORM instances just to throw it away.
+_LIST_USERS_STMT = select(
+    User.id, User.email, User.name, User.created_at, User.updated_at
+).order_by(User.created_at)
+
+_user_list_adapter = TypeAdapter(list[UserResponse])
+
+
 class UsersService(BaseService):
-    def list_users(self) -> list[User]:
-        return self.session.query(User).order_by(User.created_at).all()
+    async def list_users(self) -> list[UserResponse]:
+        result = await self.session.execute(_LIST_USERS_STMT)
+        return _user_list_adapter.validate_python(
+            result.all(), from_attributes=True
+        )
 
-    def get_user(self, user_id: uuid.UUID) -> User:
-        user = self.session.query(User).filter(User.id == user_id).first()
+    async def get_user(self, user_id: uuid.UUID) -> User:
+        # PK lookup: hits the identity map first, so no SQL at all when
+        # the user is already loaded in this session.
+        user = await self.session.get(User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         return user
 
-    def create_user(self, body: UserCreate) -> User:
-        existing = self.session.query(User).filter(User.email == body.email).first()
+    async def create_user(self, body: UserCreate) -> User:
+        # Cheap indexed probe before paying for the password hash; the
+        # unique constraint below still catches a concurrent insert.
+        existing = (
+            await self.session.execute(
+                select(User.id).where(User.email == body.email)
+            )
+        ).first()
         if existing:
             raise HTTPException(status_code=409, detail="Email already registered")
-        user = User(
-            email=body.email,
-            name=body.name,
-            hashed_password=hash_password(body.password),
+        stmt = (
+            insert(User)
+            .values(
+                email=body.email,
+                name=body.name,
+                hashed_password=await asyncio.to_thread(hash_password, body.password),
+            )
+            .returning(User)
         )
-        self.session.add(user)
-        self.session.commit()
-        self.session.refresh(user)
+        try:
+            user = (await self.session.execute(stmt)).scalar_one()
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            raise HTTPException(status_code=409, detail="Email already registered")
         return user
 
-    def update_user(self, user_id: uuid.UUID, body: UserUpdate) -> User:
-        user = self.get_user(user_id)
-        updates = body.model_dump(exclude_unset=True)
-        for field, value in updates.items():
-            setattr(user, field, value)
-        self.session.commit()
-        self.session.refresh(user)
+    async def update_user(self, user_id: uuid.UUID, body: UserUpdate) -> User:
+        # Already-validated attributes; plain getattr skips the recursive
+        # model_dump machinery.
+        updates = {k: getattr(body, k) for k in body.model_fields_set}
+        if not updates:
+            return await self.get_user(user_id)
+        # One UPDATE carrying only the changed columns; no fetch, no
+        # dirty-tracking flush.
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**updates)
+            .returning(User)
+        )
+        user = (await self.session.execute(stmt)).scalar_one_or_none()
+        if user is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        await self.session.commit()
         return user
 
-    def delete_user(self, user_id: uuid.UUID) -> None:
-        user = self.get_user(user_id)
-        self.session.delete(user)
-        self.session.commit()
+    async def delete_user(self, user_id: uuid.UUID) -> None:
+        user = await self.get_user(user_id)
+        await self.session.delete(user)
+        await self.session.commit()
@@ -1,40 +1,97 @@
-import os
-import tempfile
+import asyncio
 
 import pytest
+from argon2 import PasswordHasher
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.db.schema import Base
 from app.db.session import get_db
 from app.main import app
 
+# SQLite ships with journal_mode=DELETE and synchronous=FULL, so every
+# commit pays a full fsync; the suite is dominated by small writes.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def _tune_sqlite(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+@pytest.fixture(autouse=True)
+def _fast_password_hashing(monkeypatch):
+    # Production argon2 parameters are deliberately slow and dominate the
+    # auth tests, which only need round-trip correctness. Minimum-cost
+    # parameters keep the same code path at a fraction of the time.
+    monkeypatch.setattr(
+        "app.core.security._password_hasher",
+        PasswordHasher(time_cost=1, memory_cost=8, parallelism=1),
+    )
 
-@pytest.fixture
-def client_with_test_db():
-    db_fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(db_fd)
 
-    engine = create_engine(
-        f"sqlite:///{db_path}",
+@pytest.fixture(scope="session")
+def _test_engine():
+    # One in-memory database for the whole run: StaticPool pins a single
+    # connection so the database survives across sessions, and the schema
+    # is created once instead of per test.
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
-    Base.metadata.create_all(bind=engine)
-    TestingSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    event.listen(engine.sync_engine, "connect", _tune_sqlite)
 
-    def override_get_db():
-        db = TestingSession()
-        try:
-            yield db
-        finally:
-            db.close()
+    async def _create_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(_create_schema())
+
+    yield engine
+
+    asyncio.run(engine.dispose())
 
-    app.dependency_overrides[get_db] = override_get_db
 
+@pytest.fixture(scope="session")
+def _client(_test_engine):
+    # One TestClient for the whole run: the ASGI app, routing table and
+    # lifespan fire once instead of per test.
     with TestClient(app) as client:
         yield client
 
-    app.dependency_overrides.clear()
-    Base.metadata.drop_all(bind=engine)
-    os.unlink(db_path)
+
+@pytest.fixture
+def client_with_test_db(_test_engine, _client):
+    TestingSession = async_sessionmaker(
+        bind=_test_engine, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_db():
+        async with TestingSession() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    yield _client
+
+    app.dependency_overrides.pop(get_db, None)
+
+    # Per-test isolation without DDL: empty every table, children first.
+    async def _wipe_rows():
+        async with _test_engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                await conn.execute(table.delete())
+
+    asyncio.run(_wipe_rows())
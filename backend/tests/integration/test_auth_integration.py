@@ -1,14 +1,30 @@
+import pytest
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Tokens already issued in this test, keyed by (email, password):
+# register returns one, so _auth_header can skip a whole login round-trip
+# (and its argon2 verify). Cleared per test — the database is wiped
+# between tests, so a cached token would reference a deleted user.
+_token_cache: dict[tuple[str, str], str] = {}
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    _token_cache.clear()
+    yield
+
 
 def _register(client, email="alice@example.com", name="Alice", password="password123"):
-    return client.post(
+    resp = client.post(
         "/api/auth/register",
         json={"email": email, "name": name, "password": password},
     )
+    if resp.status_code == 201:
+        _token_cache[(email, password)] = resp.json()["access_token"]
+    return resp
 
 
 def _login(client, email="alice@example.com", password="password123"):
@@ -19,8 +35,11 @@ def _login(client, email="alice@example.com", password="password123"):
 
 
 def _auth_header(client, email="alice@example.com", password="password123"):
-    resp = _login(client, email=email, password=password)
-    token = resp.json()["access_token"]
+    token = _token_cache.get((email, password))
+    if token is None:
+        resp = _login(client, email=email, password=password)
+        token = resp.json()["access_token"]
+        _token_cache[(email, password)] = token
     return {"Authorization": f"Bearer {token}"}
 
 
@@ -1,3 +1,5 @@
+import asyncio
+
 from app.db.schema import Category
 from app.db.session import get_db
 from app.main import app
@@ -21,14 +23,20 @@ def _register_and_auth(client, email="alice@example.com"):
 
 def _seed_defaults(client):
     """Insert default categories directly into the test DB."""
-    db = next(app.dependency_overrides[get_db]())
-    defaults = [
-        Category(name="Food & Dining", color="#EF4444", is_default=True, user_id=None),
-        Category(name="Transport", color="#3B82F6", is_default=True, user_id=None),
-    ]
-    for cat in defaults:
-        db.add(cat)
-    db.commit()
+
+    async def _seed():
+        gen = app.dependency_overrides[get_db]()
+        db = await anext(gen)
+        defaults = [
+            Category(name="Food & Dining", color="#EF4444", is_default=True, user_id=None),
+            Category(name="Transport", color="#3B82F6", is_default=True, user_id=None),
+        ]
+        for cat in defaults:
+            db.add(cat)
+        await db.commit()
+        await gen.aclose()
+
+    asyncio.run(_seed())
 
 
 def _create_category(client, headers, name="Custom Cat", color="#FF0000"):
@@ -177,3 +185,48 @@ def test_delete_category_not_found(client_with_test_db):
         headers=headers,
     )
     assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# List cache
+# ---------------------------------------------------------------------------
+
+
+def test_list_cache_invalidated_on_write(client_with_test_db):
+    headers = _register_and_auth(client_with_test_db)
+
+    # Prime the cache with an empty list, then write
+    resp = client_with_test_db.get("/api/categories/", headers=headers)
+    assert resp.json() == []
+
+    cat_id = _create_category(client_with_test_db, headers)
+
+    # The cached list must have been invalidated by the create
+    resp = client_with_test_db.get("/api/categories/", headers=headers)
+    assert [c["id"] for c in resp.json()] == [cat_id]
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET
+# ---------------------------------------------------------------------------
+
+
+def test_list_categories_etag_roundtrip(client_with_test_db):
+    headers = _register_and_auth(client_with_test_db)
+    _create_category(client_with_test_db, headers)
+
+    resp = client_with_test_db.get("/api/categories/", headers=headers)
+    etag = resp.headers["ETag"]
+
+    resp = client_with_test_db.get(
+        "/api/categories/", headers={**headers, "If-None-Match": etag}
+    )
+    assert resp.status_code == 304
+
+    # A write changes the list, so the stale ETag must miss
+    _create_category(client_with_test_db, headers, name="Travel")
+    resp = client_with_test_db.get(
+        "/api/categories/", headers={**headers, "If-None-Match": etag}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.schema import Base, Category, Transaction, TransactionType, User
+from app.services.transactions import TransactionsService
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    TestingSession = async_sessionmaker(
+        bind=engine, autoflush=False, expire_on_commit=False
+    )
+    async with TestingSession() as session:
+        yield session
+    await engine.dispose()
+
+
+async def _seed_transactions(session, user_id: uuid.UUID, count: int) -> None:
+    category = Category(name="Food", color="#EF4444", user_id=user_id)
+    session.add(User(id=user_id, email="alice@example.com", name="Alice", hashed_password="x"))
+    session.add(category)
+    await session.flush()
+    for i in range(count):
+        session.add(
+            Transaction(
+                user_id=user_id,
+                type=TransactionType.expense,
+                description=f"Transaction {i}",
+                amount=10.0,
+                date=datetime.now(timezone.utc),
+                category_id=category.id,
+            )
+        )
+    await session.commit()
+
+
+def _count_queries(session):
+    statements: list[str] = []
+
+    @event.listens_for(session.get_bind(), "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [1, 10])
+async def test_list_transactions_query_count_is_constant(session, count):
+    """Eager loading must keep list_transactions at O(1) queries, not O(N)."""
+    user_id = uuid.uuid4()
+    await _seed_transactions(session, user_id, count)
+    session.expire_all()
+
+    service = TransactionsService(session=session)
+    statements = _count_queries(session)
+
+    result = await service.list_transactions(user_id=user_id)
+
+    # Serializing forces relationship access — must not lazy-load per row
+    for transaction in result["items"]:
+        assert transaction.category is not None
+
+    # 1 count + 1 transactions SELECT + 1 selectin batch for categories
+    assert len(statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_transactions_single_insert(session):
+    user_id = uuid.uuid4()
+    await _seed_transactions(session, user_id, 0)
+
+    service = TransactionsService(session=session)
+    statements = _count_queries(session)
+
+    from app.models.transaction import TransactionCreate
+
+    items = [
+        TransactionCreate(
+            type=TransactionType.expense,
+            description=f"Import {i}",
+            amount=5.0,
+            date=datetime.now(timezone.utc),
+        )
+        for i in range(20)
+    ]
+    created = await service.bulk_create_transactions(items, user_id)
+
+    assert created == 20
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 1
+
+    result = await service.list_transactions(user_id=user_id, page_size=50)
+    assert result["total"] == 20
@@ -5,22 +5,22 @@ from app.services.filters import FilterSpec, apply_filters
 
 def test_skips_none_values():
     spec = FilterSpec(param="name", build=lambda v: f"name == {v}")
-    query = MagicMock()
+    stmt = MagicMock()
 
-    apply_filters(query, [spec], {"name": None})
+    apply_filters(stmt, [spec], {"name": None})
 
-    query.filter.assert_not_called()
+    stmt.where.assert_not_called()
 
 
 def test_applies_when_value_present():
     spec = FilterSpec(param="name", build=lambda v: f"name == {v}")
-    query = MagicMock()
-    query.filter.return_value = query
+    stmt = MagicMock()
+    stmt.where.return_value = stmt
 
-    result = apply_filters(query, [spec], {"name": "Alice"})
+    result = apply_filters(stmt, [spec], {"name": "Alice"})
 
-    query.filter.assert_called_once_with("name == Alice")
-    assert result is query
+    stmt.where.assert_called_once_with("name == Alice")
+    assert result is stmt
 
 
 def test_custom_applies_skips_empty_string():
@@ -29,11 +29,11 @@ def test_custom_applies_skips_empty_string():
         build=lambda v: f"desc ILIKE {v}",
         applies=bool,
     )
-    query = MagicMock()
+    stmt = MagicMock()
 
-    apply_filters(query, [spec], {"search": ""})
+    apply_filters(stmt, [spec], {"search": ""})
 
-    query.filter.assert_not_called()
+    stmt.where.assert_not_called()
 
 
 def test_custom_applies_accepts_truthy_value():
@@ -42,13 +42,13 @@ def test_custom_applies_accepts_truthy_value():
         build=lambda v: f"desc ILIKE {v}",
         applies=bool,
     )
-    query = MagicMock()
-    query.filter.return_value = query
+    stmt = MagicMock()
+    stmt.where.return_value = stmt
 
-    result = apply_filters(query, [spec], {"search": "food"})
+    result = apply_filters(stmt, [spec], {"search": "food"})
 
-    query.filter.assert_called_once_with("desc ILIKE food")
-    assert result is query
+    stmt.where.assert_called_once_with("desc ILIKE food")
+    assert result is stmt
 
 
 def test_multiple_specs_partial_match():
@@ -56,21 +56,21 @@ def test_multiple_specs_partial_match():
         FilterSpec(param="a", build=lambda v: f"a == {v}"),
         FilterSpec(param="b", build=lambda v: f"b == {v}"),
     ]
-    query = MagicMock()
-    query.filter.return_value = query
+    stmt = MagicMock()
+    stmt.where.return_value = stmt
 
-    apply_filters(query, specs, {"a": 1, "b": None})
+    apply_filters(stmt, specs, {"a": 1, "b": None})
 
-    query.filter.assert_called_once_with("a == 1")
+    stmt.where.assert_called_once_with("a == 1")
 
 
 def test_missing_param_in_dict_is_skipped():
     spec = FilterSpec(param="missing", build=lambda v: f"x == {v}")
-    query = MagicMock()
+    stmt = MagicMock()
 
-    apply_filters(query, [spec], {})
+    apply_filters(stmt, [spec], {})
 
-    query.filter.assert_not_called()
+    stmt.where.assert_not_called()
 
 
 def test_all_specs_applied():
@@ -78,19 +78,19 @@ def test_all_specs_applied():
         FilterSpec(param="a", build=lambda v: f"a == {v}"),
         FilterSpec(param="b", build=lambda v: f"b == {v}"),
     ]
-    query = MagicMock()
-    query.filter.return_value = query
+    stmt = MagicMock()
+    stmt.where.return_value = stmt
 
-    apply_filters(query, specs, {"a": 1, "b": 2})
+    apply_filters(stmt, specs, {"a": 1, "b": 2})
 
-    query.filter.assert_called_once_with("a == 1", "b == 2")
+    stmt.where.assert_called_once_with("a == 1", "b == 2")
 
 
 def test_returns_original_query_when_no_filters_apply():
     spec = FilterSpec(param="x", build=lambda v: f"x == {v}")
-    query = MagicMock()
+    stmt = MagicMock()
 
-    result = apply_filters(query, [spec], {"x": None})
+    result = apply_filters(stmt, [spec], {"x": None})
 
-    assert result is query
-    query.filter.assert_not_called()
+    assert result is stmt
+    stmt.where.assert_not_called()